@@ -2,21 +2,118 @@
 Configuration management module for Playwright Pytest Framework.
 
 This module provides a Config class for managing environment variables,
-configuration settings, and other application-level configurations.
+configuration settings, and other application-level configurations, plus a
+frozen Settings snapshot built once via get_settings().
 """
 
 import os
-from typing import Optional, Any, Dict
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Optional, Any, Callable, ClassVar, Dict, FrozenSet, Generic, Mapping, Tuple, TypeVar,
+    overload,
+)
 from pathlib import Path
 
+# Single snapshot of the process environment, taken once at import time
+_ENV: Dict[str, str] = dict(os.environ)
 
-class Config:
+_TRUTHY: FrozenSet[str] = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+_MISSING = object()
+
+T = TypeVar("T")
+
+# Setting names whose values must never be printed
+_SENSITIVE_RE = re.compile(r"PASSWORD|TOKEN|KEY|SECRET")
+
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    return value.lower() in _TRUTHY
+
+
+class _CachedEnv(Generic[T]):
+    """
+    Descriptor that lazily reads and parses an environment variable.
+
+    The raw value is looked up in the ``_ENV`` snapshot on first access,
+    converted with ``cast`` and memoized, so unused settings cost nothing
+    and repeated reads are a single attribute lookup.
+    """
+
+    @overload
+    def __init__(self: "_CachedEnv[str]", key: str, default: str) -> None: ...
+
+    @overload
+    def __init__(self: "_CachedEnv[Optional[str]]", key: str, default: None) -> None: ...
+
+    @overload
+    def __init__(self, key: str, default: str, cast: Callable[[str], T]) -> None: ...
+
+    def __init__(
+        self,
+        key: str,
+        default: Optional[str],
+        cast: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """
+        Initialize the descriptor.
+
+        Args:
+            key: Environment variable name
+            default: Raw value used when the variable is not set
+            cast: Optional conversion applied to the raw value
+        """
+        self.key = key
+        self.default = default
+        self.cast = cast
+        self._cache: Any = _MISSING
+
+    def __get__(self, instance: Any, owner: Any = None) -> T:
+        if self._cache is _MISSING:
+            raw = _ENV.get(self.key, self.default)
+            self._cache = self.cast(raw) if raw is not None and self.cast else raw
+        value: T = self._cache
+        return value
+
+    def reset(self) -> None:
+        """Drop the memoized value so the next access re-parses it."""
+        self._cache = _MISSING
+
+
+class _ConfigMeta(type):
+    """
+    Metaclass that invalidates derived values on any public attribute write.
+
+    Covers Config.set(), plain assignment and pytest's monkeypatch (including
+    its undo), so memoized snapshots and environment checks never go stale.
+    """
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            cls._invalidate()  # type: ignore[attr-defined]
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            cls._invalidate()  # type: ignore[attr-defined]
+
+
+class Config(metaclass=_ConfigMeta):
     """
     Configuration class for managing environment variables and settings.
     
     This class provides a centralized way to manage all configuration settings
     used throughout the test framework, including URLs, timeouts, browser
     settings, and other environment-specific configurations.
+    
+    Assigning to a setting (directly, via set() or via monkeypatch) drops all
+    memoized values derived from it.
     """
     
     # ============ BASE PATHS ============
@@ -27,61 +124,64 @@ class Config:
     DATA_DIR: Path = BASE_DIR / "data"
     
     # ============ ENVIRONMENT SETTINGS ============
-    ENV: str = os.getenv("ENV", "dev").lower()
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() in ("true", "1", "yes")
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    ENV = _CachedEnv("ENV", "dev", str.lower)
+    DEBUG = _CachedEnv("DEBUG", "False", _to_bool)
+    LOG_LEVEL = _CachedEnv("LOG_LEVEL", "INFO")
     
     # ============ BASE URLS ============
-    BASE_URL: str = os.getenv("BASE_URL", "http://localhost:3000")
-    API_BASE_URL: str = os.getenv("API_BASE_URL", "http://localhost:8000/api")
+    BASE_URL = _CachedEnv("BASE_URL", "http://localhost:3000")
+    API_BASE_URL = _CachedEnv("API_BASE_URL", "http://localhost:8000/api")
     
     # ============ BROWSER CONFIGURATION ============
-    BROWSER_TYPE: str = os.getenv("BROWSER_TYPE", "chromium").lower()
-    HEADLESS: bool = os.getenv("HEADLESS", "True").lower() in ("true", "1", "yes")
-    SLOW_MO: int = int(os.getenv("SLOW_MO", "0"))
-    VIEWPORT_WIDTH: int = int(os.getenv("VIEWPORT_WIDTH", "1920"))
-    VIEWPORT_HEIGHT: int = int(os.getenv("VIEWPORT_HEIGHT", "1080"))
-    DISABLE_ANIMATIONS: bool = os.getenv("DISABLE_ANIMATIONS", "True").lower() in ("true", "1", "yes")
+    BROWSER_TYPE = _CachedEnv("BROWSER_TYPE", "chromium", str.lower)
+    HEADLESS = _CachedEnv("HEADLESS", "True", _to_bool)
+    SLOW_MO = _CachedEnv("SLOW_MO", "0", int)
+    VIEWPORT_WIDTH = _CachedEnv("VIEWPORT_WIDTH", "1920", int)
+    VIEWPORT_HEIGHT = _CachedEnv("VIEWPORT_HEIGHT", "1080", int)
+    DISABLE_ANIMATIONS = _CachedEnv("DISABLE_ANIMATIONS", "True", _to_bool)
     
     # ============ TIMEOUT SETTINGS (in milliseconds) ============
-    DEFAULT_TIMEOUT: int = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
-    NAVIGATION_TIMEOUT: int = int(os.getenv("NAVIGATION_TIMEOUT", "30000"))
-    WAIT_FOR_TIMEOUT: int = int(os.getenv("WAIT_FOR_TIMEOUT", "5000"))
-    NETWORK_IDLE_TIMEOUT: int = int(os.getenv("NETWORK_IDLE_TIMEOUT", "10000"))
+    DEFAULT_TIMEOUT = _CachedEnv("DEFAULT_TIMEOUT", "30000", int)
+    NAVIGATION_TIMEOUT = _CachedEnv("NAVIGATION_TIMEOUT", "30000", int)
+    WAIT_FOR_TIMEOUT = _CachedEnv("WAIT_FOR_TIMEOUT", "5000", int)
+    NETWORK_IDLE_TIMEOUT = _CachedEnv("NETWORK_IDLE_TIMEOUT", "10000", int)
     
     # ============ RETRY CONFIGURATION ============
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
-    RETRY_DELAY: int = int(os.getenv("RETRY_DELAY", "1000"))  # milliseconds
+    MAX_RETRIES = _CachedEnv("MAX_RETRIES", "3", int)
+    RETRY_DELAY = _CachedEnv("RETRY_DELAY", "1000", int)  # milliseconds
     
     # ============ PARALLEL EXECUTION ============
-    PARALLEL_WORKERS: int = int(os.getenv("PARALLEL_WORKERS", "4"))
+    PARALLEL_WORKERS = _CachedEnv("PARALLEL_WORKERS", "4", int)
     
     # ============ SCREENSHOT & VIDEO SETTINGS ============
-    SCREENSHOT_ON_FAILURE: bool = os.getenv("SCREENSHOT_ON_FAILURE", "True").lower() in ("true", "1", "yes")
-    RECORD_VIDEO: bool = os.getenv("RECORD_VIDEO", "False").lower() in ("true", "1", "yes")
+    SCREENSHOT_ON_FAILURE = _CachedEnv("SCREENSHOT_ON_FAILURE", "True", _to_bool)
+    RECORD_VIDEO = _CachedEnv("RECORD_VIDEO", "False", _to_bool)
     VIDEO_DIR: Path = REPORTS_DIR / "videos"
     SCREENSHOT_DIR: Path = REPORTS_DIR / "screenshots"
     
     # ============ TEST REPORTING ============
-    GENERATE_HTML_REPORT: bool = os.getenv("GENERATE_HTML_REPORT", "True").lower() in ("true", "1", "yes")
-    REPORT_FORMAT: str = os.getenv("REPORT_FORMAT", "html").lower()
+    GENERATE_HTML_REPORT = _CachedEnv("GENERATE_HTML_REPORT", "True", _to_bool)
+    REPORT_FORMAT = _CachedEnv("REPORT_FORMAT", "html", str.lower)
     
     # ============ AUTHENTICATION ============
-    USERNAME: Optional[str] = os.getenv("USERNAME", None)
-    PASSWORD: Optional[str] = os.getenv("PASSWORD", None)
-    API_KEY: Optional[str] = os.getenv("API_KEY", None)
-    AUTH_TOKEN: Optional[str] = os.getenv("AUTH_TOKEN", None)
+    USERNAME = _CachedEnv("USERNAME", None)
+    PASSWORD = _CachedEnv("PASSWORD", None)
+    API_KEY = _CachedEnv("API_KEY", None)
+    AUTH_TOKEN = _CachedEnv("AUTH_TOKEN", None)
     
     # ============ DATABASE CONFIGURATION ============
-    DB_HOST: str = os.getenv("DB_HOST", "localhost")
-    DB_PORT: int = int(os.getenv("DB_PORT", "5432"))
-    DB_NAME: str = os.getenv("DB_NAME", "test_db")
-    DB_USER: str = os.getenv("DB_USER", "postgres")
-    DB_PASSWORD: Optional[str] = os.getenv("DB_PASSWORD", None)
+    DB_HOST = _CachedEnv("DB_HOST", "localhost")
+    DB_PORT = _CachedEnv("DB_PORT", "5432", int)
+    DB_NAME = _CachedEnv("DB_NAME", "test_db")
+    DB_USER = _CachedEnv("DB_USER", "postgres")
+    DB_PASSWORD = _CachedEnv("DB_PASSWORD", None)
     
     # ============ NOTIFICATION SETTINGS ============
-    SLACK_WEBHOOK_URL: Optional[str] = os.getenv("SLACK_WEBHOOK_URL", None)
-    EMAIL_RECIPIENTS: Optional[str] = os.getenv("EMAIL_RECIPIENTS", None)
+    SLACK_WEBHOOK_URL = _CachedEnv("SLACK_WEBHOOK_URL", None)
+    EMAIL_RECIPIENTS = _CachedEnv("EMAIL_RECIPIENTS", None)
+    
+    # Bumped on every change so memoized snapshots can be keyed on it
+    _version: int = 0
     
     @classmethod
     def get(cls, key: str, default: Any = None) -> Any:
@@ -109,68 +209,95 @@ class Config:
         setattr(cls, key, value)
     
     @classmethod
-    def get_all_as_dict(cls) -> Dict[str, Any]:
+    def get_all_as_dict(cls) -> Mapping[str, Any]:
         """
         Get all configuration settings as a dictionary.
         
         Returns:
-            Dictionary of all class attributes (excluding private/magic methods)
+            Read-only mapping of all class attributes (excluding private/magic methods)
         """
-        return {
-            key: value for key, value in cls.__dict__.items()
-            if not key.startswith("_") and not callable(value)
-        }
+        return cls._snapshot(cls._version)
     
-    @classmethod
-    def is_dev(cls) -> bool:
-        """Check if running in development environment."""
-        return cls.ENV == "dev"
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _snapshot(version: int) -> Mapping[str, Any]:
+        """Build the settings mapping for a given config version (memoized)."""
+        config_dict = {}
+        for key in Config.__dict__:
+            if key.startswith("_"):
+                continue
+            value = getattr(Config, key)
+            if not callable(value):
+                config_dict[key] = value
+        return MappingProxyType(config_dict)
     
-    @classmethod
-    def is_test(cls) -> bool:
-        """Check if running in test environment."""
-        return cls.ENV == "test"
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _masked_snapshot(version: int) -> Tuple[str, ...]:
+        """
+        Build the printable settings lines for a given config version (memoized).
+        
+        Values of sensitive keys are replaced with ``***MASKED***``.
+        """
+        return tuple(
+            f"{key}: {'***MASKED***' if _SENSITIVE_RE.search(key.upper()) else value}"
+            for key, value in sorted(Config._snapshot(version).items())
+        )
+    
+    # ============ ENVIRONMENT CHECKS ============
+    # Bound by _specialize_env_checks() to functions returning precomputed
+    # booleans; re-bound whenever the settings change
+    is_dev: ClassVar[Callable[[], bool]]
+    is_test: ClassVar[Callable[[], bool]]
+    is_prod: ClassVar[Callable[[], bool]]
+    is_ci: ClassVar[Callable[[], bool]]
     
     @classmethod
-    def is_prod(cls) -> bool:
-        """Check if running in production environment."""
-        return cls.ENV == "prod"
+    def _reset_cache(cls) -> None:
+        """Re-snapshot the environment and drop all memoized settings (for tests)."""
+        _ENV.clear()
+        _ENV.update(os.environ)
+        # Restore descriptors that Config.set() may have replaced with plain values,
+        # bypassing the metaclass hook so derived values are dropped only once
+        for name, descriptor in _ENV_FIELDS.items():
+            descriptor.reset()
+            type.__setattr__(cls, name, descriptor)
+        cls._invalidate()
     
     @classmethod
-    def is_ci(cls) -> bool:
-        """Check if running in CI/CD environment."""
-        return os.getenv("CI", "False").lower() in ("true", "1", "yes")
+    def _invalidate(cls) -> None:
+        """Drop values derived from the current settings."""
+        cls._version += 1
+        get_settings.cache_clear()
+        cls.ensure_directories.cache_clear()
+        _specialize_env_checks()
     
     @classmethod
+    @lru_cache(maxsize=1)
     def ensure_directories(cls) -> None:
-        """Create all required directories if they don't exist."""
-        directories = [
-            cls.TESTS_DIR,
-            cls.REPORTS_DIR,
-            cls.LOGS_DIR,
-            cls.DATA_DIR,
-            cls.VIDEO_DIR,
-            cls.SCREENSHOT_DIR,
-        ]
+        """Create all required directories if they don't exist (once per process)."""
+        # REPORTS_DIR is created as the parent of VIDEO_DIR and SCREENSHOT_DIR
+        leaves = {
+            str(cls.TESTS_DIR),
+            str(cls.LOGS_DIR),
+            str(cls.DATA_DIR),
+            str(cls.VIDEO_DIR),
+            str(cls.SCREENSHOT_DIR),
+        }
         
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        for directory in leaves:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
     
     @classmethod
-    def get_browser_options(cls) -> Dict[str, Any]:
+    def get_browser_options(cls) -> Mapping[str, Any]:
         """
         Get browser launch options.
         
         Returns:
-            Dictionary of browser launch options
+            Read-only mapping of browser launch options
         """
-        return {
-            "headless": cls.HEADLESS,
-            "slow_mo": cls.SLOW_MO,
-            "args": [
-                f"--disable-animations" if cls.DISABLE_ANIMATIONS else "",
-            ]
-        }
+        return get_settings().browser_options
     
     @classmethod
     def get_context_options(cls) -> Dict[str, Any]:
@@ -180,26 +307,107 @@ class Config:
         Returns:
             Dictionary of context options
         """
-        return {
-            "viewport": {
-                "width": cls.VIEWPORT_WIDTH,
-                "height": cls.VIEWPORT_HEIGHT,
-            },
-            "record_video_dir": str(cls.VIDEO_DIR) if cls.RECORD_VIDEO else None,
-        }
+        # Playwright only serializes real dicts, so hand out a fresh viewport copy
+        options = get_settings().context_options
+        return {**options, "viewport": dict(options["viewport"])}
     
     @classmethod
     def print_config(cls) -> None:
         """Print all configuration settings for debugging purposes."""
-        print("\n" + "=" * 60)
-        print("CONFIGURATION SETTINGS")
-        print("=" * 60)
-        
-        config_dict = cls.get_all_as_dict()
-        for key, value in sorted(config_dict.items()):
-            # Mask sensitive information
-            if any(sensitive in key.upper() for sensitive in ["PASSWORD", "TOKEN", "KEY", "SECRET"]):
-                value = "***MASKED***"
-            print(f"{key}: {value}")
-        
-        print("=" * 60 + "\n")
+        separator = "=" * 60
+        lines = [
+            "\n" + separator,
+            "CONFIGURATION SETTINGS",
+            separator,
+            *cls._masked_snapshot(cls._version),
+            separator + "\n",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Env-backed settings by name, so _reset_cache() can reattach overridden ones
+_ENV_FIELDS: Dict[str, _CachedEnv[Any]] = {
+    name: value for name, value in vars(Config).items() if isinstance(value, _CachedEnv)
+}
+
+
+def _const(value: bool, doc: str) -> Callable[[], bool]:
+    """Build a function that always returns ``value``."""
+    def check() -> bool:
+        return value
+
+    check.__doc__ = doc
+    return check
+
+
+def _specialize_env_checks() -> None:
+    """Bind Config's environment checks to constants for the current settings."""
+    # type.__setattr__ skips _ConfigMeta's invalidation hook, which calls this
+    env = Config.ENV
+    type.__setattr__(Config, "is_dev", staticmethod(
+        _const(env == "dev", "Check if running in development environment.")
+    ))
+    type.__setattr__(Config, "is_test", staticmethod(
+        _const(env == "test", "Check if running in test environment.")
+    ))
+    type.__setattr__(Config, "is_prod", staticmethod(
+        _const(env == "prod", "Check if running in production environment.")
+    ))
+    # CI status does not change mid-run, so it is frozen from the env snapshot too
+    type.__setattr__(Config, "is_ci", staticmethod(
+        _const(_to_bool(_ENV.get("CI", "False")), "Check if running in CI/CD environment.")
+    ))
+
+
+_specialize_env_checks()
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable snapshot of the Config settings.
+
+    Values come from Config.get_all_as_dict(), so Config stays the single
+    source of truth. Browser and context options are precomputed once in
+    ``__post_init__`` so fixtures read them as plain attributes instead of
+    rebuilding dicts.
+    """
+
+    version: int
+    values: Mapping[str, Any] = field(repr=False, compare=False)
+    browser_options: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    context_options: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        values = self.values
+        # A tuple keeps the shared args immutable; Playwright accepts any sequence
+        browser_args = tuple(
+            arg for arg in ("--disable-animations",) if values["DISABLE_ANIMATIONS"]
+        )
+        # Frozen dataclass: derived fields must bypass __setattr__
+        object.__setattr__(self, "browser_options", MappingProxyType({
+            "headless": values["HEADLESS"],
+            "slow_mo": values["SLOW_MO"],
+            "args": browser_args,
+        }))
+        object.__setattr__(self, "context_options", MappingProxyType({
+            "viewport": MappingProxyType({
+                "width": values["VIEWPORT_WIDTH"],
+                "height": values["VIEWPORT_HEIGHT"],
+            }),
+            "record_video_dir": str(values["VIDEO_DIR"]) if values["RECORD_VIDEO"] else None,
+        }))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings snapshot.
+
+    Built from Config on first call and reused afterwards; any change to a
+    Config attribute invalidates it.
+
+    Returns:
+        Frozen Settings instance
+    """
+    return Settings(Config._version, Config.get_all_as_dict())
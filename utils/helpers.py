@@ -5,16 +5,44 @@ This module provides utility functions and helper methods for common test operat
 including screenshots, element waits, clicks, fills, and other browser interactions.
 """
 
+from __future__ import annotations
+
+import itertools
 import os
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import TYPE_CHECKING, Optional, Callable, Any, ClassVar, Dict, Literal, Set
+
+if TYPE_CHECKING:
+    # Only needed for annotations; playwright is imported on first assertion
+    from playwright.sync_api import Page, Locator
+
+ElementState = Literal["attached", "detached", "visible", "hidden"]
+
+_VALID_STATES = frozenset({"attached", "detached", "visible", "hidden"})
 
-from playwright.sync_api import Page, Locator, expect
+
+@lru_cache(maxsize=1)
+def _get_expect() -> Callable:
+    """Return playwright's ``expect``, importing it on first call."""
+    from playwright.sync_api import expect
+
+    return expect
 
 
 class TestHelper:
-    """Helper class providing utility functions for test automation."""
+    """
+    Helper class providing utility functions for test automation.
+
+    Instances use ``__slots__``; subclasses that add attributes should declare
+    their own ``__slots__`` (or accept a per-instance ``__dict__``).
+    """
+
+    __slots__ = ("page", "screenshots_dir", "_loc_cache", "_screenshot_prefix", "_counter")
+
+    # Screenshot directories already created in this process
+    _ensured_dirs: ClassVar[Set[str]] = set()
 
     def __init__(self, page: Page, screenshots_dir: str = "screenshots"):
         """
@@ -26,11 +54,24 @@ class TestHelper:
         """
         self.page = page
         self.screenshots_dir = screenshots_dir
+        self._loc_cache: Dict[str, Locator] = {}
+        self._screenshot_prefix = os.path.join(self.screenshots_dir, "")
+        self._counter = itertools.count()
         self._ensure_screenshots_dir()
 
     def _ensure_screenshots_dir(self) -> None:
         """Create screenshots directory if it doesn't exist."""
+        if self.screenshots_dir in self._ensured_dirs:
+            return
         Path(self.screenshots_dir).mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(self.screenshots_dir)
+
+    def _locator(self, selector: str) -> Locator:
+        """Return a cached Locator for the selector, creating it on first use."""
+        locator = self._loc_cache.get(selector)
+        if locator is None:
+            locator = self._loc_cache[selector] = self.page.locator(selector)
+        return locator
 
     def take_screenshot(self, name: Optional[str] = None, full_page: bool = False) -> str:
         """
@@ -43,15 +84,14 @@ class TestHelper:
         Returns:
             Path to the saved screenshot file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = name or f"screenshot_{timestamp}"
-        filepath = os.path.join(self.screenshots_dir, f"{filename}.png")
+        filename = name or f"screenshot_{time.time_ns()}_{next(self._counter)}"
+        filepath = f"{self._screenshot_prefix}{filename}.png"
 
         self.page.screenshot(path=filepath, full_page=full_page)
         return filepath
 
     def wait_for_element(
-        self, selector: str, timeout: int = 30000, state: str = "visible"
+        self, selector: str, timeout: int = 30000, state: ElementState = "visible"
     ) -> Locator:
         """
         Wait for an element to appear and reach a specific state.
@@ -67,7 +107,8 @@ class TestHelper:
         Raises:
             TimeoutError: If element is not found within timeout
         """
-        locator = self.page.locator(selector)
+        assert state in _VALID_STATES, f"Invalid element state: {state!r}"
+        locator = self._locator(selector)
         locator.wait_for(state=state, timeout=timeout)
         return locator
 
@@ -82,8 +123,7 @@ class TestHelper:
             timeout: Timeout in milliseconds
             force: Force click even if element is not clickable
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.click(force=force)
+        self._locator(selector).click(force=force, timeout=timeout)
 
     def safe_fill(
         self, selector: str, text: str, timeout: int = 30000, delay: int = 0
@@ -97,8 +137,13 @@ class TestHelper:
             timeout: Timeout in milliseconds
             delay: Delay between keypresses in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.fill(text, delay=delay)
+        locator = self._locator(selector)
+        if delay:
+            # fill() has no per-key delay, so clear and type the text instead
+            locator.fill("", timeout=timeout)
+            locator.press_sequentially(text, delay=delay, timeout=timeout)
+        else:
+            locator.fill(text, timeout=timeout)
 
     def safe_type(
         self, selector: str, text: str, timeout: int = 30000, delay: int = 0
@@ -112,8 +157,7 @@ class TestHelper:
             timeout: Timeout in milliseconds
             delay: Delay between keypresses in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.type(text, delay=delay)
+        self._locator(selector).type(text, delay=delay, timeout=timeout)
 
     def safe_select_option(
         self, selector: str, value: str, timeout: int = 30000
@@ -126,8 +170,7 @@ class TestHelper:
             value: Value of the option to select
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.select_option(value)
+        self._locator(selector).select_option(value, timeout=timeout)
 
     def get_text(self, selector: str, timeout: int = 30000) -> str:
         """
@@ -160,35 +203,39 @@ class TestHelper:
         locator = self.wait_for_element(selector, timeout=timeout)
         return locator.get_attribute(attribute)
 
-    def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
+    def is_element_visible(self, selector: str, timeout: int = 0) -> bool:
         """
         Check if an element is visible.
 
         Args:
             selector: CSS selector or XPath of the element
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds; 0 checks immediately without waiting
 
         Returns:
             True if element is visible, False otherwise
         """
         try:
+            if timeout == 0:
+                return self._locator(selector).is_visible()
             self.wait_for_element(selector, timeout=timeout, state="visible")
             return True
         except Exception:
             return False
 
-    def is_element_present(self, selector: str, timeout: int = 5000) -> bool:
+    def is_element_present(self, selector: str, timeout: int = 0) -> bool:
         """
         Check if an element is present in the DOM.
 
         Args:
             selector: CSS selector or XPath of the element
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds; 0 checks immediately without waiting
 
         Returns:
             True if element is present, False otherwise
         """
         try:
+            if timeout == 0:
+                return self._locator(selector).count() > 0
             self.wait_for_element(selector, timeout=timeout, state="attached")
             return True
         except Exception:
@@ -204,7 +251,7 @@ class TestHelper:
         Returns:
             Number of elements found
         """
-        return self.page.locator(selector).count()
+        return self._locator(selector).count()
 
     def check_checkbox(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -214,9 +261,7 @@ class TestHelper:
             selector: CSS selector or XPath of the checkbox
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        if not locator.is_checked():
-            locator.check()
+        self._locator(selector).check(timeout=timeout)
 
     def uncheck_checkbox(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -226,9 +271,7 @@ class TestHelper:
             selector: CSS selector or XPath of the checkbox
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        if locator.is_checked():
-            locator.uncheck()
+        self._locator(selector).uncheck(timeout=timeout)
 
     def is_checkbox_checked(self, selector: str, timeout: int = 30000) -> bool:
         """
@@ -252,8 +295,7 @@ class TestHelper:
             selector: CSS selector or XPath of the element
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.scroll_into_view_if_needed()
+        self._locator(selector).scroll_into_view_if_needed(timeout=timeout)
 
     def hover_element(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -263,8 +305,7 @@ class TestHelper:
             selector: CSS selector or XPath of the element
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.hover()
+        self._locator(selector).hover(timeout=timeout)
 
     def double_click_element(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -274,8 +315,7 @@ class TestHelper:
             selector: CSS selector or XPath of the element
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.dblclick()
+        self._locator(selector).dblclick(timeout=timeout)
 
     def right_click_element(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -285,8 +325,7 @@ class TestHelper:
             selector: CSS selector or XPath of the element
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.click(button="right")
+        self._locator(selector).click(button="right", timeout=timeout)
 
     def clear_field(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -296,8 +335,7 @@ class TestHelper:
             selector: CSS selector or XPath of the input element
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.clear()
+        self._locator(selector).clear(timeout=timeout)
 
     def press_key(self, selector: str, key: str, timeout: int = 30000) -> None:
         """
@@ -308,8 +346,7 @@ class TestHelper:
             key: Key to press (e.g., "Enter", "Tab", "Escape")
             timeout: Timeout in milliseconds
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        locator.press(key)
+        self._locator(selector).press(key, timeout=timeout)
 
     def navigate_to(self, url: str) -> None:
         """
@@ -318,18 +355,22 @@ class TestHelper:
         Args:
             url: URL to navigate to
         """
+        self._loc_cache.clear()
         self.page.goto(url)
 
     def reload_page(self) -> None:
         """Reload the current page."""
+        self._loc_cache.clear()
         self.page.reload()
 
     def go_back(self) -> None:
         """Navigate back to the previous page."""
+        self._loc_cache.clear()
         self.page.go_back()
 
     def go_forward(self) -> None:
         """Navigate forward to the next page."""
+        self._loc_cache.clear()
         self.page.go_forward()
 
     def wait_for_url(
@@ -411,10 +452,12 @@ class TestHelper:
             timeout: Timeout in milliseconds
 
         Raises:
-            AssertionError: If element text doesn't match expected
+            AssertionError: If element is not visible or text doesn't match expected
         """
-        locator = self.wait_for_element(selector, timeout=timeout)
-        expect(locator).to_contain_text(expected_text, timeout=timeout)
+        locator = self._locator(selector)
+        # to_contain_text alone would also pass for a hidden element
+        _get_expect()(locator).to_be_visible(timeout=timeout)
+        _get_expect()(locator).to_contain_text(expected_text, timeout=timeout)
 
     def assert_element_visible(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -427,8 +470,8 @@ class TestHelper:
         Raises:
             AssertionError: If element is not visible
         """
-        locator = self.page.locator(selector)
-        expect(locator).to_be_visible(timeout=timeout)
+        locator = self._locator(selector)
+        _get_expect()(locator).to_be_visible(timeout=timeout)
 
     def assert_element_enabled(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -441,8 +484,8 @@ class TestHelper:
         Raises:
             AssertionError: If element is not enabled
         """
-        locator = self.page.locator(selector)
-        expect(locator).to_be_enabled(timeout=timeout)
+        locator = self._locator(selector)
+        _get_expect()(locator).to_be_enabled(timeout=timeout)
 
     def assert_element_disabled(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -455,8 +498,8 @@ class TestHelper:
         Raises:
             AssertionError: If element is not disabled
         """
-        locator = self.page.locator(selector)
-        expect(locator).to_be_disabled(timeout=timeout)
+        locator = self._locator(selector)
+        _get_expect()(locator).to_be_disabled(timeout=timeout)
 
     def assert_checkbox_checked(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -469,8 +512,8 @@ class TestHelper:
         Raises:
             AssertionError: If checkbox is not checked
         """
-        locator = self.page.locator(selector)
-        expect(locator).to_be_checked(timeout=timeout)
+        locator = self._locator(selector)
+        _get_expect()(locator).to_be_checked(timeout=timeout)
 
     def assert_checkbox_unchecked(self, selector: str, timeout: int = 30000) -> None:
         """
@@ -483,5 +526,5 @@ class TestHelper:
         Raises:
             AssertionError: If checkbox is checked
         """
-        locator = self.page.locator(selector)
-        expect(locator).not_to_be_checked(timeout=timeout)
+        locator = self._locator(selector)
+        _get_expect()(locator).not_to_be_checked(timeout=timeout)
@@ -3,36 +3,62 @@ Logger configuration using loguru for console and file logging.
 
 This module provides a centralized logger configuration that outputs logs to both
 console and file with appropriate formatting and rotation settings.
+
+Sinks are added lazily the first time ``logger`` is accessed from this module,
+so importing it does not open any log files.
 """
 
 import sys
-from pathlib import Path
-from loguru import logger
-
-# Configure the logs directory
-LOGS_DIR = Path(__file__).parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
-
-# Remove default handler
-logger.remove()
-
-# Console handler configuration
-logger.add(
-    sink=sys.stdout,
-    format="<level>{time:YYYY-MM-DD HH:mm:ss}</level> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
-    colorize=True,
-)
-
-# File handler configuration
-logger.add(
-    sink=LOGS_DIR / "app_{time:YYYY-MM-DD_HH-mm-ss}.log",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-    rotation="500 MB",
-    retention="7 days",
-    compression="zip",
-    colorize=False,
-)
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import loguru
+
+from .config import Config
+
+if TYPE_CHECKING:
+    # Resolved lazily at runtime by the module-level __getattr__ below
+    from loguru import logger
+
+# Share the logs directory with Config so both modules always agree
+LOGS_DIR = Config.LOGS_DIR
+
+
+@lru_cache(maxsize=1)
+def _configure() -> None:
+    """Add the console and file sinks to the loguru logger (runs once)."""
+    LOGS_DIR.mkdir(exist_ok=True)
+
+    # Remove default handler
+    loguru.logger.remove()
+
+    # Console handler configuration
+    loguru.logger.add(
+        sink=sys.stdout,
+        format="<level>{time:YYYY-MM-DD HH:mm:ss}</level> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        level="DEBUG",
+        colorize=True,
+    )
+
+    # File handler configuration
+    loguru.logger.add(
+        # Keep the {time} field: loguru derives the retention glob (app_*.log*) from it
+        sink=LOGS_DIR / "app_{time:YYYY-MM-DD_HH-mm-ss}.log",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        level="DEBUG",
+        rotation="500 MB",
+        retention="7 days",
+        compression="zip",
+        colorize=False,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Configure the sinks on first access to ``logger``."""
+    if name == "logger":
+        _configure()
+        return loguru.logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["logger"]